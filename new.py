@@ -10,7 +10,7 @@ A single-file, BBA-friendly chatbot that runs in the terminal.
 - FAQ for business topics (BBA-focused)
 - Safe calculator (AST-based)
 - CSV quick insights (read local CSV, compute stats)
-- Memory persistence to JSON (remembers your name & preferences)
+- Memory persistence to JSON (remembers your name & preferences; history in JSONL)
 - Commands: /help, /reset, /export_history, /summary, /loadcsv path, /setname Name
 
 Run:
@@ -23,90 +23,116 @@ import json
 import os
 import sys
 import random
+import time
 import datetime as dt
-import statistics as stats
-import csv
-import ast
-from typing import Any, Dict, List, Tuple, Optional
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
 # ----------------------------- Utilities ----------------------------- #
 
+_LAST_SEC: List[Any] = [0, ""]  # [epoch second, formatted string]
+
+
 def now_str() -> str:
-    return dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # several calls land in the same second each turn; format once per second
+    t = int(time.time())
+    if t != _LAST_SEC[0]:
+        _LAST_SEC[0] = t
+        _LAST_SEC[1] = dt.datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
+    return _LAST_SEC[1]
+
+
+_WS_RE = re.compile(r"\s+")
 
 
 def normalize(text: str) -> str:
-    text = text.strip().lower()
     # keep basic punctuation for intent detection but normalize whitespace
-    text = re.sub(r"\s+", " ", text)
-    return text
+    return _WS_RE.sub(" ", text.strip().lower())
+
+
+def quick_stats(vals: List[float]) -> Tuple[float, float, float]:
+    """Mean, median and population stdev; uses NumPy if it happens to be installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        import statistics as stats
+        return stats.mean(vals), stats.median(vals), stats.pstdev(vals)
+    arr = np.fromiter(vals, dtype=np.float64, count=len(vals))
+    return float(arr.mean()), float(np.median(arr)), float(arr.std())
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes (orjson if installed)."""
+    try:
+        import orjson
+    except ImportError:
+        return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+
+CSV_TYPE_SAMPLES = 32  # non-empty values per column used to guess its type
+
+
+def sample_columns(rows: List[List[str]], ncols: int, k: int = CSV_TYPE_SAMPLES) -> List[List[str]]:
+    """First k non-empty values of each column; stops once every column has k."""
+    samples: List[List[str]] = [[] for _ in range(ncols)]
+    pending = set(range(ncols))
+    for r in rows:
+        if not pending:
+            break
+        for i in list(pending):
+            if i < len(r) and r[i] != '':
+                samples[i].append(r[i])
+                if len(samples[i]) >= k:
+                    pending.discard(i)
+    return samples
 
 
 # ------------------------- Safe Calculator --------------------------- #
 # Evaluate arithmetic expressions safely using AST; supports + - * / ** % ( )
-class SafeEvaluator(ast.NodeVisitor):
-    ALLOWED_NODES = (
-        ast.Expression, ast.BinOp, ast.UnaryOp, ast.Num, ast.Constant,
+@lru_cache(maxsize=None)
+def _allowed_nodes() -> Tuple[type, ...]:
+    import ast  # deferred: only sessions that use the calculator pay for it
+    return (
+        ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
         ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod, ast.Pow,
-        ast.USub, ast.UAdd, ast.Load, ast.Call, ast.Name
+        ast.USub, ast.UAdd, ast.Load, ast.Name
     )
+
+
+class SafeEvaluator:
     ALLOWED_NAMES = {
         # optional handy constants
         'pi': 3.141592653589793,
         'e': 2.718281828459045,
     }
 
-    def visit(self, node):  # type: ignore[override]
-        if not isinstance(node, self.ALLOWED_NODES):
-            raise ValueError("Disallowed expression")
-        return super().visit(node)
-
     def eval(self, expr: str) -> float:
+        import ast
+        allowed = _allowed_nodes()
         tree = ast.parse(expr, mode='eval')
-        return self._eval(tree.body)
-
-    def _eval(self, node):
-        if isinstance(node, ast.Num):
-            return node.n
-        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-            return node.value
-        if isinstance(node, ast.BinOp):
-            left = self._eval(node.left)
-            right = self._eval(node.right)
-            if isinstance(node.op, ast.Add):
-                return left + right
-            if isinstance(node.op, ast.Sub):
-                return left - right
-            if isinstance(node.op, ast.Mult):
-                return left * right
-            if isinstance(node.op, ast.Div):
-                return left / right
-            if isinstance(node.op, ast.Mod):
-                return left % right
-            if isinstance(node.op, ast.Pow):
-                return left ** right
-        if isinstance(node, ast.UnaryOp):
-            val = self._eval(node.operand)
-            if isinstance(node.op, ast.UAdd):
-                return +val
-            if isinstance(node.op, ast.USub):
-                return -val
-        if isinstance(node, ast.Name):
-            if node.id in self.ALLOWED_NAMES:
-                return self.ALLOWED_NAMES[node.id]
-            raise ValueError("Unknown name: %s" % node.id)
-        raise ValueError("Unsupported expression")
+        # single validation pass, then let the interpreter run the arithmetic
+        for node in ast.walk(tree):
+            if not isinstance(node, allowed):
+                raise ValueError("Disallowed expression")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError("Unsupported expression")
+            if isinstance(node, ast.Name) and node.id not in self.ALLOWED_NAMES:
+                raise ValueError("Unknown name: %s" % node.id)
+        code = compile(tree, '<calc>', 'eval')
+        return eval(code, {"__builtins__": {}}, self.ALLOWED_NAMES)
 
 
 # ----------------------- Simple Sentiment ---------------------------- #
-POS_WORDS = set(
+POS_WORDS = frozenset(
     """
     good great excellent awesome amazing love like happy satisfied helpful fast
     fantastic superb brilliant wonderful recommend positive smooth convenient
     affordable reasonable polite friendly quick impressive neat clean reliable
     """.split()
 )
-NEG_WORDS = set(
+NEG_WORDS = frozenset(
     """
     bad poor terrible awful hate dislike unhappy unsatisfied slow rude broken
     worst late expensive dirty confusing frustrating unhelpful problem issue
@@ -115,17 +141,17 @@ NEG_WORDS = set(
 )
 
 
+_TOKEN_RE = re.compile(r"[a-zA-Z']+")
+
+
 def sentiment_score(text: str) -> float:
-    tokens = re.findall(r"[a-zA-Z']+", text.lower())
-    if not tokens:
+    counts = Counter(_TOKEN_RE.findall(text.lower()))
+    if not counts:
         return 0.0
-    score = 0
-    for t in tokens:
-        if t in POS_WORDS:
-            score += 1
-        elif t in NEG_WORDS:
-            score -= 1
-    return score / max(1, len(tokens))
+    words = counts.keys()
+    pos = sum(counts[w] for w in POS_WORDS & words)
+    neg = sum(counts[w] for w in NEG_WORDS & words)
+    return (pos - neg) / sum(counts.values())
 
 
 # -------------------------- Knowledge Base -------------------------- #
@@ -148,6 +174,8 @@ FAQ = {
     "six sigma": "Six Sigma reduces process variation; DMAIC: Define, Measure, Analyze, Improve, Control.",
 }
 
+_FAQ_KEYS = tuple(FAQ)  # keys are stored lowercased, matching normalize()
+
 SMALLTALK = [
     "Totally noted.",
     "Got it!",
@@ -170,49 +198,123 @@ GOODBYES = [
 
 # ----------------------------- Memory ------------------------------- #
 class Memory:
-    def __init__(self, path: str = "bot_memory.json"):
+    """Profile (name & preferences) in a small JSON file, chat history in an
+    append-only JSONL file so each turn writes one line instead of the world."""
+
+    HISTORY_LIMIT = 400        # turns kept in memory and after compaction
+    COMPACT_EVERY = 1000       # appends between history file rewrites
+
+    def __init__(self, path: str = "bot_memory.json", history_path: str = "bot_history.jsonl"):
         self.path = path
+        self.history_path = history_path
         self.data: Dict[str, Any] = {
             "user_name": None,
             "preferences": {},
-            "history": [],  # list of {time, role, text}
+            "history": [],  # list of {time, role, text[, intent]}
         }
+        self._appends = 0
+        self._file_lines = 0  # lines in the history file as found by load()
         self.load()
+        self._hist_f = open(self.history_path, "a", encoding="utf-8", buffering=1 << 16)
+        # short sessions never reach COMPACT_EVERY; trim what earlier ones left behind
+        if self._file_lines > self.HISTORY_LIMIT:
+            self._compact()
 
     def load(self):
         if os.path.exists(self.path):
             try:
                 with open(self.path, "r", encoding="utf-8") as f:
-                    self.data = json.load(f)
+                    profile = json.load(f)
+                self.data["user_name"] = profile.get("user_name")
+                self.data["preferences"] = profile.get("preferences", {})
+                legacy = profile.get("history")
+            except Exception:
+                legacy = None
+            # older versions kept history inside the profile; move it over once
+            if legacy and not os.path.exists(self.history_path):
+                self._write_history(legacy[-self.HISTORY_LIMIT:])
+        if os.path.exists(self.history_path):
+            try:
+                tail = deque(maxlen=self.HISTORY_LIMIT)
+                with open(self.history_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        tail.append(line)
+                        self._file_lines += 1
             except Exception:
-                pass
+                tail = deque()
+            history = []
+            for line in tail:
+                # one bad line (e.g. cut short by a kill mid-write) shouldn't cost the rest
+                try:
+                    history.append(json.loads(line))
+                except ValueError:
+                    continue
+            self.data["history"] = history
 
     def save(self):
+        """Persist the profile only; history is appended as it happens."""
+        profile = {"user_name": self.data.get("user_name"), "preferences": self.data.get("preferences", {})}
+        # write a temp file and swap it in so a crash never leaves half a file
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(dumps_json(profile))
+            os.replace(tmp, self.path)
+        except Exception:
+            pass
+
+    def add_history(self, role: str, text: str, intent: Optional[str] = None):
+        record = {"time": now_str(), "role": role, "text": text}
+        if intent is not None:
+            record["intent"] = intent
+        self.data["history"].append(record)
+        if len(self.data["history"]) > self.HISTORY_LIMIT:
+            self.data["history"] = self.data["history"][-self.HISTORY_LIMIT:]
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            self._hist_f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._hist_f.flush()  # one line per turn reaches disk even if we're killed
         except Exception:
             pass
+        self._appends += 1
+        if self._appends >= self.COMPACT_EVERY:
+            self._compact()
 
-    def add_history(self, role: str, text: str):
-        self.data["history"].append({"time": now_str(), "role": role, "text": text})
-        # Keep last 200 turns
-        if len(self.data["history"]) > 400:
-            self.data["history"] = self.data["history"][-400:]
+    def reset(self):
+        self.data = {"user_name": None, "preferences": {}, "history": []}
         self.save()
+        self._compact()
+
+    def close(self):
+        self._hist_f.close()
+
+    def _compact(self):
+        # rewrite the history file down to what we keep in memory
+        self._hist_f.close()
+        self._write_history(self.data["history"])
+        self._hist_f = open(self.history_path, "a", encoding="utf-8", buffering=1 << 16)
+        self._appends = 0
+
+    def _write_history(self, records: List[Dict[str, Any]]):
+        tmp = self.history_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+            os.replace(tmp, self.history_path)
+        except Exception:
+            pass
 
 
 # ---------------------------- NLU/NLP ------------------------------- #
 INTENT_PATTERNS = [
     ("greet", re.compile(r"\b(hi|hello|hey|assalam|salam)\b", re.I)),
     ("goodbye", re.compile(r"\b(bye|goodbye|see you|tata)\b", re.I)),
-    ("set_name", re.compile(r"\bmy name is (.+)", re.I)),
+    ("set_name", re.compile(r"\bmy name is (?P<set_name_arg>.+)", re.I)),
     ("ask_time", re.compile(r"\b(time|clock|what time)\b", re.I)),
     ("ask_date", re.compile(r"\b(date|today)\b", re.I)),
     ("calculator", re.compile(r"^=|\b(calc|calculate|evaluate)\b", re.I)),
-    ("faq", re.compile(r"\b(sunk cost|opportunity cost|npv|irr|capm|beta|perpetuity|4p|stp|swot|kpi|lean|six sigma)\b", re.I)),
-    ("load_csv", re.compile(r"^/loadcsv\s+(.+)$", re.I)),
-    ("setname_cmd", re.compile(r"^/setname\s+(.+)$", re.I)),
+    ("faq", re.compile(r"\b(?P<faq_key>" + "|".join(map(re.escape, _FAQ_KEYS)) + r")\b", re.I)),
+    ("load_csv", re.compile(r"^/loadcsv\s+(?P<load_csv_arg>.+)$", re.I)),
+    ("setname_cmd", re.compile(r"^/setname\s+(?P<setname_cmd_arg>.+)$", re.I)),
     ("help", re.compile(r"^/help$", re.I)),
     ("reset", re.compile(r"^/reset$", re.I)),
     ("export", re.compile(r"^/export_history$", re.I)),
@@ -220,12 +322,27 @@ INTENT_PATTERNS = [
     ("complaint", re.compile(r"\b(complain|issue|problem|refund|return|support)\b", re.I)),
 ]
 
+# leading "calc"/"calculate"/"evaluate" keyword stripped before evaluation
+_CALC_PREFIX_RE = re.compile(r"^(?:calc(?:ulate)?|evaluate)\s+", re.I)
+
+
+# intents whose handler needs a captured argument -> name of that group
+_INTENT_ARGS = {
+    "set_name": "set_name_arg",
+    "faq": "faq_key",
+    "load_csv": "load_csv_arg",
+    "setname_cmd": "setname_cmd_arg",
+}
+
 
-def detect_intent(text: str) -> Tuple[str, Optional[re.Match]]:
+@lru_cache(maxsize=1024)
+def detect_intent(text: str) -> Tuple[str, Optional[str]]:
+    """Return (intent, captured argument or None); cached since users repeat themselves."""
     for name, pattern in INTENT_PATTERNS:
         m = pattern.search(text)
         if m:
-            return name, m
+            arg_group = _INTENT_ARGS.get(name)
+            return name, m.group(arg_group) if arg_group else None
     # fallback heuristics
     if any(k in text for k in ("help", "commands")):
         return "help", None
@@ -240,7 +357,25 @@ class Chatbot:
         self.pending_task: Optional[Dict[str, Any]] = None  # for slot filling
         self.loaded_csv: Optional[str] = None
         self.csv_headers: List[str] = []
-        self.csv_rows: List[Dict[str, Any]] = []
+        self.csv_rows: List[List[str]] = []
+        self.csv_col: Dict[str, int] = {}  # header -> index into each row
+        # intent -> handler(captured arg, raw user text)
+        self._dispatch: Dict[str, Callable[[Optional[str], str], str]] = {
+            "greet": lambda arg, raw: self.handle_greet(),
+            "goodbye": lambda arg, raw: self.handle_goodbye(),
+            "set_name": lambda arg, raw: self.handle_set_name(arg),
+            "ask_time": lambda arg, raw: self.handle_time(),
+            "ask_date": lambda arg, raw: self.handle_date(),
+            "calculator": lambda arg, raw: self.handle_calculator(raw),
+            "faq": lambda arg, raw: self.handle_faq(arg),
+            "load_csv": lambda arg, raw: self.handle_load_csv(arg),
+            "setname_cmd": lambda arg, raw: self.handle_setname_cmd(arg),
+            "help": lambda arg, raw: self.handle_help(),
+            "reset": lambda arg, raw: self.handle_reset(),
+            "export": lambda arg, raw: self.handle_export(),
+            "summary": lambda arg, raw: self.handle_summary(),
+            "complaint": lambda arg, raw: self.handle_complaint(raw),
+        }
 
     # --------------- Reply helpers --------------- #
     def reply(self, text: str) -> str:
@@ -261,14 +396,14 @@ class Chatbot:
     def handle_goodbye(self) -> str:
         return self.reply(random.choice(GOODBYES))
 
-    def handle_set_name(self, m: re.Match) -> str:
-        name = m.group(1).strip().split()[0]
+    def handle_set_name(self, arg: str) -> str:
+        name = arg.strip().split()[0]
         self.mem.data["user_name"] = name.title()
         self.mem.save()
         return self.reply(f"Nice to meet you, {self.mem.data['user_name']}! I'll remember your name.")
 
-    def handle_setname_cmd(self, m: re.Match) -> str:
-        name = m.group(1).strip()
+    def handle_setname_cmd(self, arg: str) -> str:
+        name = arg.strip()
         self.mem.data["user_name"] = name.title()
         self.mem.save()
         return self.reply(f"Got it! I'll call you {self.mem.data['user_name']}.")
@@ -299,82 +434,93 @@ class Chatbot:
 
     def handle_export(self) -> str:
         path = "chat_history.txt"
-        with open(path, "w", encoding="utf-8") as f:
-            for item in self.mem.data.get("history", []):
-                f.write(f"[{item['time']}] {item['role'].upper()}: {item['text']}\n")
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(
+                f"[{item['time']}] {item['role'].upper()}: {item['text']}\n"
+                for item in self.mem.data.get("history", [])
+            )
         return self.reply(f"History exported to {path} (in the current folder).")
 
     def handle_summary(self) -> str:
         hist = self.mem.data.get("history", [])[-20:]
         # simple extractive summary: pick assistant/user highlights
-        user_msgs = [h["text"] for h in hist if h["role"] == "user"]
-        intents = []
-        for u in user_msgs:
-            intent, _ = detect_intent(normalize(u))
-            intents.append(intent)
-        intent_counts = {i: intents.count(i) for i in set(intents)}
+        # user turns carry the intent detected when they were sent; only older
+        # records without one need re-detecting
+        intent_counts = Counter(
+            h.get("intent") or detect_intent(normalize(h["text"]))[0]
+            for h in hist if h["role"] == "user"
+        )
         bullets = ", ".join(f"{k}×{v}" for k, v in intent_counts.items()) or "varied topics"
         return self.reply(f"Recent summary: we discussed {bullets}. I also saved your name if you set it.")
 
     def handle_reset(self) -> str:
-        self.mem.data = {"user_name": None, "preferences": {}, "history": []}
-        self.mem.save()
+        self.mem.reset()
         return self.reply("Memory cleared. Fresh start!")
 
     def handle_calculator(self, text: str) -> str:
         # extract expression after '=' if present
-        expr = text
-        if text.strip().startswith("="):
-            expr = text.strip()[1:]
-        expr = re.sub(r"^(calc(ulate)?|evaluate)\s+", "", expr, flags=re.I)
+        expr = text.strip()
+        if expr.startswith("="):
+            expr = expr[1:]
+        expr = _CALC_PREFIX_RE.sub("", expr)
         try:
             val = self.safe_eval.eval(expr)
             return self.reply(f"Result: {val}")
         except Exception as e:
             return self.reply(f"Sorry, I couldn't evaluate that. ({e})")
 
-    def handle_faq(self, text: str) -> str:
-        for k, v in FAQ.items():
-            if k in text:
-                return self.reply(f"{k.title()}: {v}")
+    def handle_faq(self, key: str) -> str:
+        # the faq intent already captured which topic was mentioned
+        k = key.lower()
+        if k in FAQ:
+            return self.reply(f"{k.title()}: {FAQ[k]}")
         return self.reply("I didn't find that topic. Try /help for supported FAQs.")
 
     # ---- CSV quick insights ---- #
-    def handle_load_csv(self, m: re.Match) -> str:
-        path = m.group(1).strip().strip('"')
+    def handle_load_csv(self, arg: str) -> str:
+        import csv  # deferred: most sessions never load a CSV
+        path = arg.strip().strip('"')
         if not os.path.exists(path):
             return self.reply("CSV not found. Please provide a valid path.")
         self.loaded_csv = path
-        self.csv_headers = []
-        self.csv_rows = []
+        # plain rows + a header index; no per-row dict like csv.DictReader builds
         with open(path, newline='', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            self.csv_headers = reader.fieldnames or []
-            for row in reader:
-                self.csv_rows.append(row)
+            reader = csv.reader(f)
+            self.csv_headers = next(reader, [])
+            self.csv_rows = [row for row in reader if row]  # skip blank lines like DictReader
+        self.csv_col = {h: i for i, h in enumerate(self.csv_headers)}
         if not self.csv_rows:
             return self.reply(f"Loaded {path}, but it has no rows.")
         msg = [f"Loaded {path} with {len(self.csv_rows)} rows and {len(self.csv_headers)} columns."]
-        # Basic numeric stats for first numeric column
+        # Basic numeric stats for first numeric column (typed from a sample, not every row)
+        samples = sample_columns(self.csv_rows, len(self.csv_headers))
         numeric_cols = []
         for h in self.csv_headers:
-            try:
-                float(next((r[h] for r in self.csv_rows if r.get(h) not in (None, '',) ), 'nan'))
+            col_samples = samples[self.csv_col[h]]
+            parsed = 0
+            for v in col_samples:
+                try:
+                    float(v)
+                    parsed += 1
+                except ValueError:
+                    pass
+            # tolerate the odd "N/A"; the stats loop below skips unparsable cells
+            if col_samples and parsed * 2 >= len(col_samples):
                 numeric_cols.append(h)
-            except Exception:
-                continue
         if numeric_cols:
             col = numeric_cols[0]
+            i = self.csv_col[col]
             vals: List[float] = []
             for r in self.csv_rows:
                 try:
-                    vals.append(float(r[col]))
+                    vals.append(float(r[i]))
                 except Exception:
                     pass
             if vals:
+                mean, median, stdev = quick_stats(vals)
                 msg.append(
-                    f"Quick stats for '{col}': count={len(vals)}, mean={stats.mean(vals):.3f}, "
-                    f"median={stats.median(vals):.3f}, stdev={(stats.pstdev(vals)):.3f}"
+                    f"Quick stats for '{col}': count={len(vals)}, mean={mean:.3f}, "
+                    f"median={median:.3f}, stdev={stdev:.3f}"
                 )
         return self.reply("\n".join(msg))
 
@@ -418,72 +564,52 @@ class Chatbot:
     def handle(self, user_text: str) -> str:
         user_text_raw = user_text
         user_text = normalize(user_text)
-        self.mem.add_history("user", user_text_raw)
+        intent, arg = detect_intent(user_text)
+        self.mem.add_history("user", user_text_raw, intent=intent)
 
         # If we are in a slot-filling flow, prioritize it unless commands
         if self.pending_task and user_text.startswith('/') is False:
             if self.pending_task.get("type") == "complaint":
                 return self.handle_complaint(user_text_raw)
 
-        intent, m = detect_intent(user_text)
-        if intent == "greet":
-            return self.handle_greet()
-        if intent == "goodbye":
-            return self.handle_goodbye()
-        if intent == "set_name" and m:
-            return self.handle_set_name(m)
-        if intent == "ask_time":
-            return self.handle_time()
-        if intent == "ask_date":
-            return self.handle_date()
-        if intent == "calculator":
-            return self.handle_calculator(user_text_raw)
-        if intent == "faq":
-            return self.handle_faq(user_text)
-        if intent == "load_csv" and m:
-            return self.handle_load_csv(m)
-        if intent == "setname_cmd" and m:
-            return self.handle_setname_cmd(m)
-        if intent == "help":
-            return self.handle_help()
-        if intent == "reset":
-            return self.handle_reset()
-        if intent == "export":
-            return self.handle_export()
-        if intent == "summary":
-            return self.handle_summary()
-        if intent == "complaint":
-            return self.handle_complaint(user_text_raw)
-        # default
-        return self.handle_smalltalk(user_text_raw)
+        handler = self._dispatch.get(intent)
+        if handler is None:
+            return self.handle_smalltalk(user_text_raw)
+        return handler(arg, user_text_raw)
 
 
 # --------------------------- Entry Point ---------------------------- #
 
 def banner():
-    print("=" * 68)
-    print("Big AI Chatbot (No External Libraries)")
-    print("Type /help for commands. Type 'bye' to exit.")
-    print("=" * 68)
+    rule = "=" * 68
+    print(
+        f"{rule}\n"
+        "Big AI Chatbot (No External Libraries)\n"
+        "Type /help for commands. Type 'bye' to exit.\n"
+        f"{rule}"
+    )
 
 
 def run():
     bot = Chatbot()
-    banner()
-    # greet on start
-    print(bot.handle_greet())
-    while True:
-        try:
-            user = input("You: ")
-        except (EOFError, KeyboardInterrupt):
-            print()  # newline
-            user = "bye"
-        if not user.strip():
-            continue
-        resp = bot.handle(user)
-        print(resp)
-        if resp in GOODBYES:
-            break
+    try:
+        banner()
+        # greet on start
+        print(bot.handle_greet())
+        while True:
+            try:
+                user = input("You: ")
+            except (EOFError, KeyboardInterrupt):
+                print()  # newline
+                user = "bye"
+            if not user.strip():
+                continue
+            resp = bot.handle(user)
+            print(resp)
+            if resp in GOODBYES:
+                break
+    finally:
+        bot.mem.close()
 
 
 if __name__ == "__main__":
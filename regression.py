@@ -1,32 +1,25 @@
-import pandas as pd
-from sklearn.linear_model import LinearRegression
+import numpy as np
 import matplotlib.pyplot as plt
 
 # Example data
-data = {
-    "Advertising": [1, 2, 3, 4, 5],
-    "Sales": [2, 4, 5, 4, 6]
-}
-df = pd.DataFrame(data)
+advertising = np.array([1, 2, 3, 4, 5], dtype=np.float64)   # independent variable
+sales = np.array([2, 4, 5, 4, 6], dtype=np.float64)         # dependent variable
 
-# Define X and y
-X = df[["Advertising"]]   # independent variable
-y = df["Sales"]           # dependent variable
-
-# Create and fit model
-model = LinearRegression()
-model.fit(X, y)
+# Fit simple linear regression (closed form: slope = cov(x, y) / var(x))
+x_dev = advertising - advertising.mean()
+slope = (x_dev * (sales - sales.mean())).sum() / (x_dev ** 2).sum()
+intercept = sales.mean() - slope * advertising.mean()
 
 # Predict sales
-df["Predicted_Sales"] = model.predict(X)
+predicted_sales = intercept + slope * advertising
 
 # Print slope and intercept
-print("Intercept:", model.intercept_)
-print("Slope:", model.coef_[0])
+print("Intercept:", intercept)
+print("Slope:", slope)
 
 # Visualization
-plt.scatter(df["Advertising"], df["Sales"], color="blue", label="Actual Data")
-plt.plot(df["Advertising"], df["Predicted_Sales"], color="red", label="Regression Line")
+plt.scatter(advertising, sales, color="blue", label="Actual Data")
+plt.plot(advertising, predicted_sales, color="red", label="Regression Line")
 plt.xlabel("Advertising Budget ($000)")
 plt.ylabel("Sales ($000)")
 plt.legend()
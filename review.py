@@ -1,4 +1,8 @@
-from wordcloud import WordCloud
+import hashlib
+import os
+import pickle
+
+from wordcloud import WordCloud, __version__ as wordcloud_version
 import matplotlib.pyplot as plt
 
 # Sample customer reviews
@@ -10,8 +14,24 @@ I love the design and features, very user-friendly.
 Will definitely recommend to friends. Excellent value for money.
 """
 
-# Generate Word Cloud
-wordcloud = WordCloud(width=800, height=400, background_color="white", colormap="plasma").generate(text)
+# Generate Word Cloud (cached on disk, keyed by the text, settings and wordcloud version)
+settings = dict(width=800, height=400, background_color="white", colormap="plasma")
+key_src = wordcloud_version + repr(sorted(settings.items())) + text
+key = hashlib.sha1(key_src.encode("utf-8")).hexdigest()
+cache_path = f".wc_{key}.pkl"
+wordcloud = None
+if os.path.exists(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            wordcloud = pickle.load(f)
+    except Exception:
+        wordcloud = None  # truncated or unreadable cache: regenerate below
+if wordcloud is None:
+    wordcloud = WordCloud(**settings).generate(text)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(wordcloud, f)
+    os.replace(tmp_path, cache_path)
 
 # Plot it
 plt.figure(figsize=(10,6))